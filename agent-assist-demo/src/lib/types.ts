@@ -12,7 +12,7 @@ export interface KnowledgeCard {
   summary: string;
   url: string;
   category: string;
-  relevance: number;
+  relevance: number; // cosine similarity to the conversation, 0-1 (plus boosts)
   // B3: Enhanced formatting
   steps?: string[];
   keyPoints?: string[];
@@ -91,7 +91,7 @@ export interface SearchResult {
   title: string;
   url: string;
   category: string;
-  relevance: number;
+  relevance: number; // cosine similarity to the query, 0-1
 }
 
 export interface KnowledgeStats {
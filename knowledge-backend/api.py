@@ -3,33 +3,101 @@ FastAPI server for Knowledge RAG backend
 Provides endpoints for knowledge search, ingestion, and management.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, Any, Iterable, Iterator, NamedTuple, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from functools import lru_cache
+import asyncio
+import orjson
+import re
+import threading
 import time
 import os
 
-from vector_store import get_store, KnowledgeStore
-from scraper import get_sample_documents, scrape_genesys_docs, save_documents, load_documents
-from sentiment import analyze_sentiment, SentimentProvider, get_provider_info
+from vector_store import get_store, merge_results, KnowledgeStore, SAMPLE_EMBEDDINGS_PATH
+from search_cache import get_search_cache
+from ingest_pipeline import IngestPipeline
+from scraper import (
+    count_samples_by_category, count_samples_by_product,
+    filter_samples, get_sample, get_sample_documents, get_sample_lookup_stats, iter_samples_csv,
+    search_sample_keywords, search_sample_keywords_batch,
+    scrape_genesys_docs, save_documents, load_documents
+)
+from sentiment import (
+    analyze_sentiment, analyze_sentiment_batch, SentimentProvider, SentimentResult,
+    get_provider_info, get_transformer_analyzer
+)
 from mock_history import get_customer_history, get_demo_customers, clear_history_cache, DEMO_CUSTOMERS
 
+# Worker threads for blocking model inference / vector search
+API_THREADS = int(os.getenv("API_THREADS", "32"))
+# Uvicorn worker processes (each loads its own embedding model)
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+# Load the transformer sentiment model at startup instead of on its first request
+SENTIMENT_PRELOAD = os.getenv("SENTIMENT_PRELOAD", "0") == "1"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Size the thread pool used to offload blocking calls off the event loop,
+    then bind the knowledge store once and warm up its embedding model
+    (and the transformer sentiment model, with SENTIMENT_PRELOAD=1).
+    """
+    executor = ThreadPoolExecutor(max_workers=API_THREADS, thread_name_prefix="api-worker")
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    app.state.store = await asyncio.to_thread(get_store)
+    await asyncio.to_thread(app.state.store.embed_text, "warm up")
+    if SENTIMENT_PRELOAD:
+        await asyncio.to_thread(get_transformer_analyzer().warm_up)
+
+    # Background ingestion; cached search results go stale on every write
+    app.state.ingest_pipeline = IngestPipeline(app.state.store, on_write=get_search_cache().clear)
+    await app.state.ingest_pipeline.start()
+
+    yield
+
+    await app.state.ingest_pipeline.stop()
+    executor.shutdown(wait=False)
+
+
 app = FastAPI(
     title="Genesys Knowledge RAG API",
     description="RAG backend for real-time agent assist with Genesys Cloud documentation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# CORS configuration - the demo frontends (POC-1 on 3334, POC-2 on 3335)
+# call the API directly from the browser without credentials
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS",
+        "http://localhost:3334,http://localhost:3335,http://127.0.0.1:3334,http://127.0.0.1:3335"
+    ).split(",")
+    if origin.strip()
 )
 
-# CORS configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict this
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Cache-Control"],
 )
 
+# Compress larger payloads (knowledge cards, document lists, history)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # Request/Response Models
 class SearchRequest(BaseModel):
@@ -43,7 +111,7 @@ class SearchResult(BaseModel):
     title: str
     url: str
     category: str
-    relevance: float
+    relevance: float  # cosine similarity to the query, floored at 0
 
 
 class SearchResponse(BaseModel):
@@ -53,7 +121,37 @@ class SearchResponse(BaseModel):
     total_results: int
 
 
+# Maximum number of queries accepted by the batch search endpoint
+MAX_BATCH_QUERIES = 100
+
+
+class SearchBatchRequest(BaseModel):
+    queries: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_QUERIES)
+    top_k: Optional[int] = 5
+    category: Optional[str] = None
+
+
+class SearchBatchItem(BaseModel):
+    query: str
+    results: List[SearchResult]
+    total_results: int
+
+
+class SearchBatchResponse(BaseModel):
+    results: List[SearchBatchItem]
+    latency_ms: int
+    total_queries: int
+
+
+class SampleSearchBatchRequest(BaseModel):
+    queries: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_QUERIES)
+    top_k: Optional[int] = 10
+
+
 class DocumentInput(BaseModel):
+    # Frozen so the field dict can be handed to the store without copying
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     content: str
@@ -66,12 +164,21 @@ class IngestRequest(BaseModel):
 
 
 class IngestResponse(BaseModel):
-    documents_ingested: int
-    chunks_created: int
-    total_documents: int
+    job_id: str
+    documents_queued: int
     status: str
 
 
+class IngestJobResponse(BaseModel):
+    job_id: str
+    status: str  # queued, running, completed, failed
+    documents_queued: int
+    documents_ingested: int
+    chunks_total: int
+    chunks_written: int
+    error: Optional[str] = None
+
+
 class StatsResponse(BaseModel):
     total_chunks: int
     unique_documents: int
@@ -106,6 +213,17 @@ class SentimentAnalyzeResponse(BaseModel):
     breakdown: Dict[str, Any]
 
 
+class SentimentBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_QUERIES)
+    provider: Optional[str] = "vader"  # "vader" or "transformer"
+
+
+class SentimentBatchResponse(BaseModel):
+    results: List[SentimentAnalyzeResponse]
+    latency_ms: int
+    total_texts: int
+
+
 class SentimentHistoryResponse(BaseModel):
     customer_id: str
     customer_info: Dict[str, Any]
@@ -123,7 +241,7 @@ async def root():
 @app.get("/health")
 async def health():
     """Detailed health check."""
-    store = get_store()
+    store = app.state.store
     stats = store.get_stats()
     return {
         "healthy": True,
@@ -133,66 +251,137 @@ async def health():
 
 
 @app.post("/api/knowledge/search", response_model=SearchResponse)
-async def search_knowledge(request: SearchRequest):
+async def search_knowledge(request: SearchRequest, cache_control: Optional[str] = Header(None)):
     """
     Search the knowledge base for relevant documents.
+
+    Near-duplicate queries are served from the semantic cache.
+    Send `Cache-Control: no-cache` to bypass it.
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     try:
-        store = get_store()
-        results = store.search(
+        store = app.state.store
+        cache = get_search_cache()
+        use_cache = not (cache_control and "no-cache" in cache_control.lower())
+
+        # Embedding and vector search block - run them off the event loop
+        query_embedding = await asyncio.to_thread(store.encode_cached, request.query)
+        results = cache.lookup(query_embedding, request.top_k, request.category) if use_cache else None
+
+        if results is None:
+            results = await asyncio.to_thread(
+                store.search,
+                query=request.query,
+                top_k=request.top_k,
+                category_filter=request.category,
+                query_embedding=query_embedding
+            )
+            cache.store(query_embedding, request.top_k, request.category, results)
+
+        latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+
+        # Results are produced by our own store - skip re-validating them here
+        return SearchResponse.model_construct(
+            results=[SearchResult.model_construct(**r) for r in results],
             query=request.query,
+            latency_ms=latency_ms,
+            total_results=len(results)
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/knowledge/search/batch", response_model=SearchBatchResponse)
+async def search_knowledge_batch(request: SearchBatchRequest):
+    """
+    Search the knowledge base for several queries in one call.
+
+    All queries are embedded together and looked up in a single vector query.
+    """
+    start_time = time.perf_counter_ns()
+
+    # Fail fast on the first unusable query
+    for i, query in enumerate(request.queries):
+        if not query.strip():
+            raise HTTPException(status_code=422, detail=f"queries[{i}] must not be empty")
+
+    try:
+        store = app.state.store
+        batch_results = await asyncio.to_thread(
+            store.search_batch,
+            queries=request.queries,
             top_k=request.top_k,
             category_filter=request.category
         )
 
-        latency_ms = int((time.time() - start_time) * 1000)
-
-        return SearchResponse(
-            results=[SearchResult(**r) for r in results],
-            query=request.query,
+        latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+
+        return SearchBatchResponse.model_construct(
+            results=[
+                SearchBatchItem.model_construct(
+                    query=query,
+                    results=[SearchResult.model_construct(**r) for r in results],
+                    total_results=len(results)
+                )
+                for query, results in zip(request.queries, batch_results)
+            ],
             latency_ms=latency_ms,
-            total_results=len(results)
+            total_queries=len(request.queries)
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/knowledge/ingest", response_model=IngestResponse)
-async def ingest_documents(request: IngestRequest):
+@app.post("/api/knowledge/ingest", response_model=IngestResponse, status_code=202)
+async def ingest_documents(request: IngestRequest, background_tasks: BackgroundTasks):
     """
     Ingest documents into the knowledge base.
+
+    Documents are queued for background embedding and indexing; poll
+    /api/knowledge/ingest/{job_id} for progress.
     """
     try:
-        store = get_store()
+        pipeline = app.state.ingest_pipeline
 
-        # Convert Pydantic models to dicts
-        docs = [doc.model_dump() for doc in request.documents]
+        # Pass the validated field dicts through (no model_dump copy per document)
+        docs = [vars(doc) for doc in request.documents]
 
-        stats = store.ingest_documents(docs)
+        job = pipeline.create_job(len(docs))
+        background_tasks.add_task(pipeline.enqueue, job["job_id"], docs)
 
-        return IngestResponse(
-            documents_ingested=stats["documents_ingested"],
-            chunks_created=stats["chunks_created"],
-            total_documents=stats["total_documents"],
-            status="success"
+        return IngestResponse.model_construct(
+            job_id=job["job_id"],
+            documents_queued=len(docs),
+            status="accepted"
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/knowledge/ingest/{job_id}", response_model=IngestJobResponse)
+async def get_ingest_job(job_id: str):
+    """
+    Get the progress of a background ingest job.
+    """
+    job = app.state.ingest_pipeline.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return IngestJobResponse(**job)
+
+
 @app.get("/api/knowledge/stats", response_model=StatsResponse)
 async def get_stats():
     """
     Get statistics about the knowledge base.
     """
     try:
-        store = get_store()
+        store = app.state.store
         stats = store.get_stats()
-        return StatsResponse(**stats)
+        return StatsResponse.model_construct(**stats)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -202,24 +391,37 @@ async def get_stats():
 async def list_documents(limit: int = 100):
     """
     List all documents in the knowledge base.
+
+    Streams `{"documents": [...], "count": N}` as documents are produced.
     """
     try:
-        store = get_store()
-        documents = store.get_all_documents(limit=limit)
-        return {"documents": documents, "count": len(documents)}
+        store = app.state.store
+        documents = await asyncio.to_thread(store.iter_documents, limit)
+        return StreamingResponse(stream_documents(documents), media_type="application/json")
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def stream_documents(documents: Iterator[Dict]) -> Iterator[bytes]:
+    """Encode a document listing as JSON incrementally."""
+    yield b'{"documents":['
+    count = 0
+    for doc in documents:
+        yield (b"," if count else b"") + orjson.dumps(doc)
+        count += 1
+    yield b'],"count":' + str(count).encode() + b"}"
+
+
 @app.delete("/api/knowledge/documents/{doc_id}")
 async def delete_document(doc_id: str):
     """
     Delete a document from the knowledge base.
     """
     try:
-        store = get_store()
+        store = app.state.store
         success = store.delete_document(doc_id)
+        get_search_cache().clear()
 
         if success:
             return {"status": "deleted", "doc_id": doc_id}
@@ -238,27 +440,129 @@ async def clear_knowledge_base():
     Clear all documents from the knowledge base.
     """
     try:
-        store = get_store()
+        store = app.state.store
         store.clear()
+        get_search_cache().clear()
         return {"status": "cleared", "message": "All documents removed"}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/knowledge/samples")
+async def list_samples(category: Optional[str] = None, product: Optional[str] = None):
+    """
+    List the bundled sample documents, optionally filtered by category and/or product.
+    """
+    results = await asyncio.to_thread(filter_samples, category, product)
+    return {
+        "category": category,
+        "product": product,
+        "results": [sample_summary(doc) for doc in results],
+        "total_results": len(results)
+    }
+
+
+@app.get("/api/knowledge/samples/stats")
+async def get_sample_stats():
+    """
+    Get by-id sample lookup counters (hits, misses, p95 latency) and corpus size.
+
+    The counters cover GET /api/knowledge/samples/{sample_id}; keyword search
+    and export read the samples directly and aren't counted. Per-category and
+    per-product document counts are aggregated once, on the first call.
+    """
+    # Lookup stats first, so corpus_loaded reflects the state before the counts load it
+    stats = await asyncio.to_thread(get_sample_lookup_stats)
+    stats["categories"] = await asyncio.to_thread(count_samples_by_category)
+    stats["products"] = await asyncio.to_thread(count_samples_by_product)
+    return stats
+
+
+@app.get("/api/knowledge/samples/search")
+async def search_samples_by_keyword(q: str, top_k: int = 10):
+    """
+    Keyword search over the bundled sample documents (all terms must match,
+    ranked by BM25).
+
+    Lets operators check what the samples cover without loading them.
+    """
+    # The first call loads and indexes the samples - keep that off the event loop
+    results = await asyncio.to_thread(search_sample_keywords, q, top_k)
+    return sample_search_item(q, results)
+
+
+@app.post("/api/knowledge/samples/search/batch")
+async def search_samples_by_keyword_batch(request: SampleSearchBatchRequest):
+    """
+    Keyword search over the sample documents for several queries in one call.
+    """
+    batch_results = await asyncio.to_thread(search_sample_keywords_batch, request.queries, request.top_k)
+    return {
+        "results": [
+            sample_search_item(query, results)
+            for query, results in zip(request.queries, batch_results)
+        ],
+        "total_queries": len(request.queries)
+    }
+
+
+def sample_summary(doc: Any) -> Dict[str, str]:
+    """A sample document without its content, for result lists."""
+    return {"id": doc.id, "title": doc.title, "url": doc.url, "category": doc.category}
+
+
+def sample_search_item(query: str, results: List[Any]) -> Dict[str, Any]:
+    """Shape one query's sample search hits for the response."""
+    return {
+        "query": query,
+        "results": [sample_summary(doc) for doc in results],
+        "total_results": len(results)
+    }
+
+
+@app.get("/api/knowledge/samples/export")
+async def export_samples():
+    """
+    Download the sample documents as CSV, streamed a page of rows at a time.
+    """
+    return StreamingResponse(
+        iter_samples_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="genesys_samples.csv"'}
+    )
+
+
+# Registered after the fixed /samples/... paths so "stats", "search" etc. aren't taken as ids
+@app.get("/api/knowledge/samples/{sample_id}")
+async def get_sample_document(sample_id: str):
+    """
+    Get one sample document by id (read by byte offset until the samples are loaded).
+    """
+    sample = await asyncio.to_thread(get_sample, sample_id)
+    if sample is None:
+        raise HTTPException(status_code=404, detail="Sample not found")
+    return sample.to_dict()
+
+
 @app.post("/api/knowledge/load-samples")
 async def load_sample_documents():
     """
     Load sample Genesys documents into the knowledge base.
     """
     try:
-        store = get_store()
+        store = app.state.store
 
         # Get sample documents
         docs = get_sample_documents()
 
-        # Ingest them
-        stats = store.ingest_documents(docs)
+        # Ingest them in a worker thread - embedding must not block the event loop.
+        # Not queued on the pipeline: callers (start-demo.sh, the demo UI) expect
+        # the samples to be searchable once this returns, and it reuses the embedding cache
+        stats = await asyncio.to_thread(
+            store.ingest_documents, docs, embedding_cache=SAMPLE_EMBEDDINGS_PATH
+        )
+        get_search_cache().clear()
 
         return {
             "status": "success",
@@ -276,41 +580,49 @@ async def get_suggestions(request: SuggestRequest):
     Get AI suggestions based on conversation context.
     This endpoint combines RAG search with suggestion generation.
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     try:
-        store = get_store()
+        store = app.state.store
 
-        # Get the last customer message for context
-        customer_messages = [
-            m for m in request.conversation
-            if m.get("role") == "customer"
-        ]
+        # Get the last customer message for context (scan from the end)
+        last_customer_message = next(
+            (m for m in reversed(request.conversation) if m.get("role") == "customer"),
+            None
+        )
 
-        if not customer_messages:
-            return SuggestResponse(
+        if last_customer_message is None:
+            return SuggestResponse.model_construct(
                 suggestions=["Hello! How can I help you today?"],
                 knowledge_cards=[],
                 sentiment="neutral",
                 latency_ms=0
             )
 
-        last_message = customer_messages[-1].get("content", "")
+        last_message = last_customer_message.get("content", "")
+        # Lowercase once for both keyword passes
+        last_message_lower = last_message.lower()
 
-        # Search knowledge base
-        results = store.search(last_message, top_k=3)
+        # Search knowledge base - with extra context, both queries go in one batched lookup
+        if request.context:
+            batch_results = await asyncio.to_thread(
+                store.search_batch, [last_message, request.context], top_k=3
+            )
+            results = merge_results(batch_results, top_k=3)
+        else:
+            results = await asyncio.to_thread(store.search, last_message, top_k=3)
 
         # Simple sentiment detection
-        sentiment = detect_sentiment(last_message)
+        sentiment = detect_sentiment(last_message, last_message_lower)
 
         # Generate suggestions based on context
-        suggestions = generate_suggestions(last_message, results, sentiment)
+        suggestions = generate_suggestions(last_message, results, sentiment, last_message_lower)
 
         # Format knowledge cards
         knowledge_cards = [
             {
                 "title": r["title"],
-                "summary": r["content"][:200] + "..." if len(r["content"]) > 200 else r["content"],
+                "summary": r["summary"],
                 "url": r["url"],
                 "category": r["category"],
                 "relevance": r["relevance"]
@@ -318,9 +630,9 @@ async def get_suggestions(request: SuggestRequest):
             for r in results
         ]
 
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
-        return SuggestResponse(
+        return SuggestResponse.model_construct(
             suggestions=suggestions,
             knowledge_cards=knowledge_cards,
             sentiment=sentiment,
@@ -331,25 +643,131 @@ async def get_suggestions(request: SuggestRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def detect_sentiment(text: str) -> str:
-    """Simple keyword-based sentiment detection."""
-    text_lower = text.lower()
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of keywords occur in a text.
 
-    # Negative indicators
-    negative_words = [
-        "problem", "issue", "broken", "not working", "error", "failed",
-        "frustrated", "angry", "upset", "terrible", "worst", "hate",
-        "disappointed", "annoyed", "confused", "stuck", "help"
-    ]
+    All keywords are compiled into one regex that is tried at every position
+    of the text, so a single pass replaces one substring scan per keyword.
+    Results match `keyword in text` for every keyword, including keywords
+    that overlap or contain each other (e.g. "help" / "helpful").
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        # Lookahead so overlapping matches are reported; longest keyword wins per position
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+        # Keywords contained in each keyword, so shorter overlapping ones are not missed
+        self._contained = {k: frozenset(w for w in ordered if w in k) for k in ordered}
+
+    def find(self, text_lower: str) -> set:
+        """Return the set of keywords that occur in the (lowercased) text."""
+        found = set()
+        for match in self._pattern.finditer(text_lower):
+            found |= self._contained[match.group(1)]
+        return found
+
+
+# Negative indicators
+NEGATIVE_WORDS = frozenset({
+    "problem", "issue", "broken", "not working", "error", "failed",
+    "frustrated", "angry", "upset", "terrible", "worst", "hate",
+    "disappointed", "annoyed", "confused", "stuck", "help"
+})
+
+# Positive indicators
+POSITIVE_WORDS = frozenset({
+    "thanks", "thank you", "great", "good", "excellent", "perfect",
+    "happy", "pleased", "appreciate", "wonderful", "helpful", "solved"
+})
+
+SENTIMENT_MATCHER = KeywordMatcher(NEGATIVE_WORDS | POSITIVE_WORDS)
+
+# Keyword groups that trigger suggestion rules in generate_suggestions
+GREETING_KEYWORDS = frozenset({"hi", "hello", "hey"})
+SETUP_KEYWORDS = frozenset({"configure", "setup", "set up"})
+TROUBLESHOOT_KEYWORDS = frozenset({"not working", "error", "issue"})
+LOCATION_KEYWORDS = frozenset({"where", "how do i"})
+COPILOT_KEYWORDS = frozenset({"agent copilot"})
+COPILOT_MISSING_KEYWORDS = frozenset({"suggestions", "not showing", "not appearing"})
+CONFIGURE_KEYWORDS = frozenset({"configure"})
+
+
+class SuggestionRule(NamedTuple):
+    """A suggestion emitted when all keyword groups match and no excluded group does."""
+    all_of: Tuple[frozenset, ...]
+    template: str
+    none_of: frozenset = frozenset()
+    sentiment: Optional[str] = None
+    needs_result: bool = False
+
+
+# Evaluated in order; templates may use {title} and {topic} from the top result
+SUGGESTION_RULES = (
+    # Greeting responses
+    SuggestionRule(
+        (GREETING_KEYWORDS,),
+        "Hello! I'd be happy to help you today. What can I assist you with?"
+    ),
+    # Problem acknowledgment for negative sentiment
+    SuggestionRule(
+        (),
+        "I understand this can be frustrating. Let me help you resolve this issue.",
+        sentiment="negative"
+    ),
+    # Configuration questions
+    SuggestionRule(
+        (SETUP_KEYWORDS,),
+        "Based on our documentation about {title}, let me walk you through the configuration steps.",
+        needs_result=True
+    ),
+    # Troubleshooting questions
+    SuggestionRule(
+        (TROUBLESHOOT_KEYWORDS,),
+        "I found a relevant troubleshooting guide. The most common cause is usually related to configuration settings. Have you checked the {topic}?",
+        needs_result=True
+    ),
+    # Where/How questions
+    SuggestionRule(
+        (LOCATION_KEYWORDS,),
+        "You can find this in the Admin section. According to our {title} documentation, here are the steps...",
+        needs_result=True
+    ),
+    # Agent Copilot specific
+    SuggestionRule(
+        (COPILOT_KEYWORDS, COPILOT_MISSING_KEYWORDS),
+        "For Agent Copilot suggestions not appearing, please check: 1) NLU confidence threshold (try lowering to 0.6), 2) Knowledge base connection, 3) Queue configuration.",
+        needs_result=True
+    ),
+    SuggestionRule(
+        (COPILOT_KEYWORDS, CONFIGURE_KEYWORDS),
+        "To configure Agent Copilot: Navigate to Admin > AI > Agent Copilot Settings. I can guide you through each step.",
+        none_of=COPILOT_MISSING_KEYWORDS,
+        needs_result=True
+    ),
+)
+
+# Default suggestions if no specific rule matches
+DEFAULT_SUGGESTIONS = [
+    "I'll be happy to help you with that. Could you provide more details about what you're trying to accomplish?",
+    "Let me look into this for you. Can you tell me which Genesys Cloud feature this relates to?"
+]
+
+MAX_SUGGESTIONS = 3
+
+SUGGESTION_MATCHER = KeywordMatcher(
+    [keyword for rule in SUGGESTION_RULES for group in rule.all_of for keyword in group]
+)
 
-    # Positive indicators
-    positive_words = [
-        "thanks", "thank you", "great", "good", "excellent", "perfect",
-        "happy", "pleased", "appreciate", "wonderful", "helpful", "solved"
-    ]
 
-    negative_count = sum(1 for word in negative_words if word in text_lower)
-    positive_count = sum(1 for word in positive_words if word in text_lower)
+def detect_sentiment(text: str, text_lower: Optional[str] = None) -> str:
+    """Simple keyword-based sentiment detection."""
+    if text_lower is None:
+        text_lower = text.lower()
+
+    found = SENTIMENT_MATCHER.find(text_lower)
+    negative_count = len(NEGATIVE_WORDS & found)
+    positive_count = len(POSITIVE_WORDS & found)
 
     if negative_count > positive_count:
         return "negative"
@@ -359,54 +777,74 @@ def detect_sentiment(text: str) -> str:
         return "neutral"
 
 
-def generate_suggestions(message: str, knowledge_results: List[Dict], sentiment: str) -> List[str]:
+def generate_suggestions(
+    message: str,
+    knowledge_results: List[Dict],
+    sentiment: str,
+    message_lower: Optional[str] = None
+) -> List[str]:
     """Generate response suggestions based on context and knowledge."""
+    if message_lower is None:
+        message_lower = message.lower()
+    found = SUGGESTION_MATCHER.find(message_lower)
+
+    title = knowledge_results[0]["title"] if knowledge_results else ""
     suggestions = []
-    message_lower = message.lower()
 
-    # Greeting responses
-    if any(word in message_lower for word in ["hi", "hello", "hey"]):
-        suggestions.append("Hello! I'd be happy to help you today. What can I assist you with?")
+    for rule in SUGGESTION_RULES:
+        if rule.needs_result and not knowledge_results:
+            continue
+        if rule.sentiment is not None and rule.sentiment != sentiment:
+            continue
+        if not all(not group.isdisjoint(found) for group in rule.all_of):
+            continue
+        if not rule.none_of.isdisjoint(found):
+            continue
 
-    # Problem acknowledgment for negative sentiment
-    if sentiment == "negative":
-        suggestions.append("I understand this can be frustrating. Let me help you resolve this issue.")
+        suggestions.append(rule.template.format(title=title, topic=title.lower().replace("about ", "")))
+        if len(suggestions) == MAX_SUGGESTIONS:
+            break
 
-    # Generate suggestions from knowledge results
-    if knowledge_results:
-        top_result = knowledge_results[0]
+    return suggestions or DEFAULT_SUGGESTIONS[:MAX_SUGGESTIONS]
 
-        # Configuration questions
-        if "configure" in message_lower or "setup" in message_lower or "set up" in message_lower:
-            suggestions.append(f"Based on our documentation about {top_result['title']}, let me walk you through the configuration steps.")
 
-        # Troubleshooting questions
-        if "not working" in message_lower or "error" in message_lower or "issue" in message_lower:
-            suggestions.append(f"I found a relevant troubleshooting guide. The most common cause is usually related to configuration settings. Have you checked the {top_result['title'].lower().replace('about ', '')}?")
+# =====================
+# Sentiment Analysis API
+# =====================
 
-        # Where/How questions
-        if "where" in message_lower or "how do i" in message_lower:
-            suggestions.append(f"You can find this in the Admin section. According to our {top_result['title']} documentation, here are the steps...")
+# Repeated texts (demo refreshes, re-sent messages) skip model inference
+SENTIMENT_CACHE_SIZE = 4096
+_sentiment_cache_state = threading.local()
 
-        # Agent Copilot specific
-        if "agent copilot" in message_lower:
-            if "suggestions" in message_lower or "not showing" in message_lower or "not appearing" in message_lower:
-                suggestions.append("For Agent Copilot suggestions not appearing, please check: 1) NLU confidence threshold (try lowering to 0.6), 2) Knowledge base connection, 3) Queue configuration.")
-            elif "configure" in message_lower:
-                suggestions.append("To configure Agent Copilot: Navigate to Admin > AI > Agent Copilot Settings. I can guide you through each step.")
 
-    # Default suggestions if no specific matches
-    if not suggestions:
-        suggestions.append("I'll be happy to help you with that. Could you provide more details about what you're trying to accomplish?")
-        suggestions.append("Let me look into this for you. Can you tell me which Genesys Cloud feature this relates to?")
+class _UncachedSentiment(Exception):
+    """Carries a fallback (error) result out of the LRU without caching it."""
 
-    # Limit to 3 suggestions
-    return suggestions[:3]
+    def __init__(self, result: SentimentResult):
+        self.result = result
 
 
-# =====================
-# Sentiment Analysis API
-# =====================
+@lru_cache(maxsize=SENTIMENT_CACHE_SIZE)
+def _cached_sentiment(provider_value: str, text: str) -> SentimentResult:
+    _sentiment_cache_state.miss = True
+    result = analyze_sentiment(text, SentimentProvider(provider_value))
+    if "error" in result.breakdown:
+        raise _UncachedSentiment(result)
+    return result
+
+
+def analyze_sentiment_cached(text: str, provider: SentimentProvider) -> SentimentResult:
+    """analyze_sentiment behind an LRU cache; cache hits report processing_time_ms=0."""
+    _sentiment_cache_state.miss = False
+    try:
+        result = _cached_sentiment(provider.value, text)
+    except _UncachedSentiment as e:
+        return e.result
+
+    if not _sentiment_cache_state.miss:
+        result = replace(result, processing_time_ms=0)
+    return result
+
 
 @app.post("/api/sentiment/analyze", response_model=SentimentAnalyzeResponse)
 async def analyze_text_sentiment(request: SentimentAnalyzeRequest):
@@ -417,14 +855,12 @@ async def analyze_text_sentiment(request: SentimentAnalyzeRequest):
     - vader: Fast rule-based analysis (~5ms)
     - transformer: ML-based DistilBERT (~50-200ms)
     """
-    start_time = time.time()
-
     try:
         # Map string provider to enum
         provider = SentimentProvider.TRANSFORMER if request.provider == "transformer" else SentimentProvider.VADER
 
         # Analyze sentiment
-        result = analyze_sentiment(request.text, provider)
+        result = await asyncio.to_thread(analyze_sentiment_cached, request.text, provider)
 
         return SentimentAnalyzeResponse(
             provider=result.provider,
@@ -439,6 +875,29 @@ async def analyze_text_sentiment(request: SentimentAnalyzeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/sentiment/analyze/batch", response_model=SentimentBatchResponse)
+async def analyze_text_sentiment_batch(request: SentimentBatchRequest):
+    """
+    Analyze sentiment of several texts in one call.
+
+    The transformer provider scores all texts in batched forward passes.
+    """
+    start_time = time.perf_counter_ns()
+
+    try:
+        provider = SentimentProvider.TRANSFORMER if request.provider == "transformer" else SentimentProvider.VADER
+        results = await asyncio.to_thread(analyze_sentiment_batch, request.texts, provider)
+
+        return SentimentBatchResponse(
+            results=[SentimentAnalyzeResponse(**result.to_dict()) for result in results],
+            latency_ms=(time.perf_counter_ns() - start_time) // 1_000_000,
+            total_texts=len(results)
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/sentiment/history/{customer_id}", response_model=SentimentHistoryResponse)
 async def get_sentiment_history(customer_id: str, days: int = 90):
     """
@@ -516,4 +975,8 @@ async def reset_sentiment_history():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=3336)
+    if API_WORKERS > 1:
+        # Multiple processes need an import string; inference is GIL-bound
+        uvicorn.run("api:app", host="0.0.0.0", port=3336, workers=API_WORKERS)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=3336)
@@ -0,0 +1,182 @@
+"""
+Ingest Pipeline - background document ingestion
+Chunks are queued, embedded by several worker tasks, and flushed to the
+vector store in batches by a single writer, so ingest requests return
+immediately and concurrent ingests don't contend on collection writes.
+"""
+
+from typing import List, Dict, Optional, Callable
+import asyncio
+import os
+import time
+import uuid
+
+from vector_store import KnowledgeStore
+
+# Constants
+QUEUE_MAX_SIZE = 256
+EMBED_BATCH_SIZE = 32
+WRITE_BATCH_SIZE = 64
+WRITE_FLUSH_SECONDS = 0.5
+# Each worker's encode() already spreads over all cores via torch intra-op
+# threads on the shared model; more workers only oversubscribe the CPU.
+# Two keep one batch embedding while the next is being chunked / queued.
+EMBED_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))
+MAX_FINISHED_JOBS = 100
+
+
+class IngestPipeline:
+    """Queue-based ingestion: N embedding workers feeding one index writer."""
+
+    def __init__(
+        self,
+        store: KnowledgeStore,
+        num_workers: int = EMBED_WORKERS,
+        on_write: Optional[Callable[[], None]] = None
+    ):
+        """Initialize the pipeline (call start() from a running event loop)."""
+        self.store = store
+        self.num_workers = max(1, num_workers)
+        self.on_write = on_write
+
+        self.jobs: Dict[str, Dict] = {}
+        self._chunk_queue: Optional[asyncio.Queue] = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start the embedding workers and the writer."""
+        self._chunk_queue = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+        self._write_queue = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+        self._tasks = [asyncio.create_task(self._embed_worker()) for _ in range(self.num_workers)]
+        self._tasks.append(asyncio.create_task(self._writer()))
+
+    async def stop(self):
+        """Cancel all pipeline tasks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def create_job(self, document_count: int) -> Dict:
+        """Register a new ingest job and return it."""
+        self._prune_jobs()
+
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": "queued",
+            "documents_queued": document_count,
+            "documents_ingested": 0,
+            "chunks_total": 0,
+            "chunks_written": 0,
+            "error": None,
+            "created_at": time.time(),
+            "_enqueued": False
+        }
+        self.jobs[job["job_id"]] = job
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Get the public status of an ingest job."""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        return {k: v for k, v in job.items() if not k.startswith("_")}
+
+    async def enqueue(self, job_id: str, documents: List[Dict]):
+        """Chunk documents and feed them into the pipeline (run as a background task)."""
+        job = self.jobs[job_id]
+        job["status"] = "running"
+
+        try:
+            records, doc_count = await asyncio.to_thread(self.store.prepare_chunks, documents)
+        except Exception as e:
+            self._fail(job, e)
+            return
+
+        job["documents_ingested"] = doc_count
+        job["chunks_total"] = len(records)
+
+        # Bounded queue - blocks here when the embedders fall behind
+        for record in records:
+            await self._chunk_queue.put((job_id, record))
+
+        job["_enqueued"] = True
+        self._check_done(job)
+
+    async def _embed_worker(self):
+        """Pull chunks off the queue and embed them in small batches."""
+        while True:
+            batch = [await self._chunk_queue.get()]
+            while len(batch) < EMBED_BATCH_SIZE and not self._chunk_queue.empty():
+                batch.append(self._chunk_queue.get_nowait())
+
+            try:
+                embeddings = await asyncio.to_thread(
+                    self.store.embed_texts,
+                    [record["embed_text"] for _, record in batch]
+                )
+            except Exception as e:
+                for job_id, _ in batch:
+                    self._fail(self.jobs.get(job_id), e)
+                continue
+
+            for item, embedding in zip(batch, embeddings):
+                await self._write_queue.put((item[0], item[1], embedding))
+
+    async def _writer(self):
+        """Single writer: flush embedded chunks every WRITE_BATCH_SIZE items or WRITE_FLUSH_SECONDS."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pending = [await self._write_queue.get()]
+            deadline = loop.time() + WRITE_FLUSH_SECONDS
+
+            while len(pending) < WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._write_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(pending)
+
+    async def _flush(self, pending: List):
+        """Write one batch of embedded chunks and update job progress."""
+        try:
+            await asyncio.to_thread(
+                self.store.add_chunks,
+                [record for _, record, _ in pending],
+                [embedding for _, _, embedding in pending]
+            )
+        except Exception as e:
+            for job_id, _, _ in pending:
+                self._fail(self.jobs.get(job_id), e)
+            return
+
+        if self.on_write:
+            self.on_write()
+
+        for job_id, _, _ in pending:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                job["chunks_written"] += 1
+                self._check_done(job)
+
+    def _check_done(self, job: Dict):
+        if job["status"] == "running" and job["_enqueued"] and job["chunks_written"] >= job["chunks_total"]:
+            job["status"] = "completed"
+
+    def _fail(self, job: Optional[Dict], error: Exception):
+        if job is not None and job["status"] != "failed":
+            print(f"Ingest job {job['job_id']} failed: {error}")
+            job["status"] = "failed"
+            job["error"] = str(error)
+
+    def _prune_jobs(self):
+        """Forget the oldest finished jobs so the job table stays bounded."""
+        finished = [j for j in self.jobs.values() if j["status"] in ("completed", "failed")]
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job["job_id"]]
@@ -14,10 +14,21 @@ Usage:
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from collections import Counter
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple, Union
+from dataclasses import dataclass
+from bisect import bisect
+from itertools import accumulate
+from functools import lru_cache
 import random
-import hashlib
+import zlib
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to the NumPy path
+    njit = None
 
 
 @dataclass
@@ -35,7 +46,36 @@ class HistoricalInteraction:
     resolution: Optional[str] = None  # resolved, escalated, pending
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat record of scalars - no need for asdict's recursive deep copy
+        return {
+            'id': self.id,
+            'customer_id': self.customer_id,
+            'timestamp': self.timestamp,
+            'channel': self.channel,
+            'sentiment_score': self.sentiment_score,
+            'sentiment_label': self.sentiment_label,
+            'confidence': self.confidence,
+            'summary': self.summary,
+            'agent_id': self.agent_id,
+            'resolution': self.resolution
+        }
+
+
+@dataclass(frozen=True)
+class InteractionColumns:
+    """Column-oriented view of a customer's interactions.
+
+    Built once alongside the list of interaction dicts so summaries can be
+    computed with NumPy over contiguous arrays instead of re-projecting dicts.
+    Row i of every column describes interactions[i].
+    """
+    scores: np.ndarray         # float64, rounded like sentiment_score
+    label_codes: np.ndarray    # int8 index into _LABELS
+    channel_codes: np.ndarray  # int8 index into _CHANNELS
+    ts_epochs: np.ndarray      # int64 epoch seconds, timestamp before ISO formatting
+
+    def __len__(self) -> int:
+        return self.scores.shape[0]
 
 
 # Channel configuration with weights and sentiment-appropriate summaries
@@ -237,54 +277,160 @@ DEMO_CUSTOMERS = {
 }
 
 
+class _PersonaParams(NamedTuple):
+    """Generation parameters of one persona, flattened from CUSTOMER_PERSONAS"""
+    base: float
+    variance: float
+    trend_code: int
+    frequency: str
+
+
+# Trend names as integer codes (used by the compiled score kernel)
+_TREND_CODE = {'stable': 0, 'improving': 1, 'declining': 2, 'volatile': 3}
+
+# Persona lookup tables, built once at import - configuration is static at runtime
+_PERSONA_NAMES = tuple(CUSTOMER_PERSONAS.keys())
+_PERSONA_IDX = {name: idx for idx, name in enumerate(_PERSONA_NAMES)}
+_PERSONA_TABLE = tuple(
+    _PersonaParams(
+        base=cfg['base_sentiment'],
+        variance=cfg['variance'],
+        trend_code=_TREND_CODE.get(cfg['trend'], 0),
+        frequency=cfg['interaction_frequency']
+    )
+    for cfg in CUSTOMER_PERSONAS.values()
+)
+_DEFAULT_PERSONA_IDX = _PERSONA_IDX['satisfied_loyal']
+_DEMO_PERSONA_IDX = {cid: _PERSONA_IDX[info['persona']] for cid, info in DEMO_CUSTOMERS.items()}
+
+
+# Channel lookup tables, built once at import
+# Cumulative weights let a single uniform draw + bisect pick a channel.
+_CHANNELS = tuple(CHANNEL_CONFIG.keys())
+_CHANNEL_CUM_WEIGHTS = tuple(accumulate(CHANNEL_CONFIG[ch]['weight'] for ch in _CHANNELS))
+
+# Sentiment labels dictionary-encoded as int8 codes for the column view
+_LABELS = ('negative', 'neutral', 'positive')
+_LABEL_CODE = {label: code for code, label in enumerate(_LABELS)}
+
+# Summaries indexed [channel_code][label_code], so the generator loop does no dict walks
+_CHANNEL_SUMMARY_TABLES = tuple(
+    tuple(tuple(CHANNEL_CONFIG[ch]['summaries'][label]) for label in _LABELS)
+    for ch in _CHANNELS
+)
+_CHANNEL_HAS_AGENT = tuple(ch in ('call', 'chat') for ch in _CHANNELS)
+_OPEN_RESOLUTIONS = ('resolved', 'pending', 'resolved')
+
+
 # Version number - increment to force regeneration of all mock data
-MOCK_DATA_VERSION = "v2"
+MOCK_DATA_VERSION = "v7"
 
-def _get_seeded_random(seed_string: str) -> random.Random:
-    """Create a seeded random generator for consistent results"""
+@lru_cache(maxsize=1024)
+def _get_seed(seed_string: str) -> int:
+    """Derive a deterministic integer seed from a string"""
     # Include version in seed so data regenerates when we update the algorithm
     versioned_seed = f"{MOCK_DATA_VERSION}_{seed_string}"
-    seed = int(hashlib.md5(versioned_seed.encode()).hexdigest()[:8], 16)
-    return random.Random(seed)
+    # Non-cryptographic hash - we only need a stable 32-bit seed
+    return zlib.crc32(versioned_seed.encode())
+
+
+def _get_seeded_random(seed_string: str) -> random.Random:
+    """Create a seeded random generator for consistent results"""
+    return random.Random(_get_seed(seed_string))
+
 
+def _get_seeded_numpy_rng(seed_string: str) -> np.random.Generator:
+    """Create a seeded NumPy generator for batch draws (same seed as _get_seeded_random)"""
+    return np.random.default_rng(_get_seed(seed_string))
 
-def _generate_sentiment_score(
-    rng: random.Random,
+
+# Score thresholds for sentiment labels
+POSITIVE_THRESHOLD = 0.15
+NEGATIVE_THRESHOLD = -0.15
+
+
+def _score_kernel(
+    base: float,
+    trend_code: int,
+    progress: np.ndarray,
+    volatility: np.ndarray,
+    noise: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fused score + clamp + label loop (compiled with numba when available)"""
+    n = progress.shape[0]
+    scores = np.empty(n)
+    label_codes = np.empty(n, np.int8)
+
+    # Codes are literal so numba can compile them inline (see _TREND_CODE/_LABEL_CODE)
+    for i in range(n):
+        if trend_code == 1:
+            trend_modifier = -0.3 + progress[i] * 0.7
+        elif trend_code == 2:
+            trend_modifier = 0.3 - progress[i] * 0.7
+        elif trend_code == 3:
+            trend_modifier = volatility[i]
+        else:
+            trend_modifier = 0.0
+
+        score = min(max(base + trend_modifier + noise[i], -1.0), 1.0)
+        scores[i] = score
+
+        if score >= POSITIVE_THRESHOLD:
+            label_codes[i] = 2
+        elif score <= NEGATIVE_THRESHOLD:
+            label_codes[i] = 0
+        else:
+            label_codes[i] = 1
+
+    return scores, label_codes
+
+
+# Only worth it for long histories, but costs nothing once cached on disk
+_compiled_score_kernel = njit(cache=True)(_score_kernel) if njit is not None else None
+
+
+def _generate_sentiment_scores(
+    rng_np: np.random.Generator,
     base: float,
     variance: float,
-    trend: str,
-    progress: float  # 0.0 to 1.0, how far through the time period
-) -> float:
-    """Generate a sentiment score with trend consideration"""
+    trend_code: int,
+    progress: np.ndarray  # 0.0 to 1.0 per interaction, how far through the time period
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate sentiment scores and label codes for all interactions at once, with trend consideration"""
+    n = progress.shape[0]
+
+    # Random draws happen here so both kernels see the same stream
+    volatility = rng_np.uniform(-0.3, 0.3, n) if trend_code == _TREND_CODE['volatile'] else np.zeros(n)
+    # Generate scores with variance (reduced for clearer trends)
+    actual_variance = variance * 0.6  # Reduce noise for clearer demo
+    noise = rng_np.uniform(-actual_variance, actual_variance, n)
 
-    # Apply trend modifier - stronger effect for clearer demo visualization
-    trend_modifier = 0.0
+    if _compiled_score_kernel is not None:
+        return _compiled_score_kernel(base, trend_code, progress, volatility, noise)
 
-    if trend == 'improving':
+    # Apply trend modifier - stronger effect for clearer demo visualization
+    if trend_code == _TREND_CODE['improving']:
         # Start negative, end positive - clear upward trajectory
         trend_modifier = -0.3 + (progress * 0.7)  # -0.3 at start, +0.4 at end
-    elif trend == 'declining':
+    elif trend_code == _TREND_CODE['declining']:
         # Start positive, end negative - clear downward trajectory
         trend_modifier = 0.3 - (progress * 0.7)  # +0.3 at start, -0.4 at end
-    elif trend == 'volatile':
-        trend_modifier = rng.uniform(-0.3, 0.3)
-    # 'stable' has no trend modifier
-
-    # Generate score with variance (reduced for clearer trends)
-    actual_variance = variance * 0.6  # Reduce noise for clearer demo
-    score = base + trend_modifier + rng.uniform(-actual_variance, actual_variance)
+    else:
+        # 'volatile' swings randomly, 'stable' has no trend modifier
+        trend_modifier = volatility
 
     # Clamp to valid range
-    return max(-1.0, min(1.0, score))
+    scores = np.clip(base + trend_modifier + noise, -1.0, 1.0)
+    return scores, _scores_to_label_codes(scores)
 
 
-def _score_to_label(score: float) -> str:
-    """Convert numeric score to sentiment label"""
-    if score >= 0.15:
-        return 'positive'
-    elif score <= -0.15:
-        return 'negative'
-    return 'neutral'
+def _scores_to_label_codes(scores: np.ndarray) -> np.ndarray:
+    """Convert numeric scores to int8 sentiment label codes"""
+    return np.select(
+        [scores >= POSITIVE_THRESHOLD, scores <= NEGATIVE_THRESHOLD],
+        [_LABEL_CODE['positive'], _LABEL_CODE['negative']],
+        _LABEL_CODE['neutral']
+    ).astype(np.int8)
 
 
 def _get_interaction_count(rng: random.Random, frequency: str, days: int) -> int:
@@ -321,99 +467,115 @@ def generate_customer_history(
     Returns:
         List of historical interaction records
     """
+    interactions, _ = _generate_history(customer_id, days, persona)
+    return interactions
+
+
+def _generate_history(
+    customer_id: str,
+    days: int,
+    persona: Optional[str]
+) -> Tuple[List[Dict[str, Any]], InteractionColumns]:
+    """Generate interaction records plus the matching column view"""
     # Use customer_id + days as seed for consistency
     rng = _get_seeded_random(f"{customer_id}_{days}")
 
     # Get persona config
-    if persona is None:
-        if customer_id in DEMO_CUSTOMERS:
-            persona = DEMO_CUSTOMERS[customer_id]['persona']
-        else:
-            persona = rng.choice(list(CUSTOMER_PERSONAS.keys()))
+    if persona is not None:
+        persona_idx = _PERSONA_IDX.get(persona, _DEFAULT_PERSONA_IDX)
+    elif customer_id in _DEMO_PERSONA_IDX:
+        persona_idx = _DEMO_PERSONA_IDX[customer_id]
+    else:
+        persona_idx = _PERSONA_IDX[rng.choice(_PERSONA_NAMES)]
 
-    persona_config = CUSTOMER_PERSONAS.get(persona, CUSTOMER_PERSONAS['satisfied_loyal'])
+    params = _PERSONA_TABLE[persona_idx]
 
     # Determine number of interactions
-    num_interactions = _get_interaction_count(
-        rng,
-        persona_config['interaction_frequency'],
-        days
+    num_interactions = _get_interaction_count(rng, params.frequency, days)
+
+    # Generate timestamps spread over the period, drawn as one batch of offsets
+    rng_np = _get_seeded_numpy_rng(f"{customer_id}_{days}")
+    start_epoch = int((datetime.now() - timedelta(days=days)).timestamp())
+
+    offsets_days = rng_np.random(num_interactions) * days
+    hours = rng_np.integers(8, 21, num_interactions)
+    minutes = rng_np.integers(0, 60, num_interactions)
+    offsets = (offsets_days * 86400 + hours * 3600 + minutes * 60).astype(np.int64)
+    offsets.sort()
+    ts_epochs = start_epoch + offsets
+    timestamps = [datetime.fromtimestamp(ts) for ts in ts_epochs.tolist()]
+
+    # Calculate progress through time period (0.0 to 1.0) for every interaction
+    progress = offsets / (days * 86400)
+
+    # Generate all sentiment scores and labels in one vectorized pass
+    scores, label_codes = _generate_sentiment_scores(
+        rng_np, params.base, params.variance, params.trend_code, progress
     )
-
-    # Generate timestamps spread over the period
-    now = datetime.now()
-    start_date = now - timedelta(days=days)
-
-    timestamps = sorted([
-        start_date + timedelta(
-            days=rng.random() * days,
-            hours=rng.randint(8, 20),
-            minutes=rng.randint(0, 59)
-        )
-        for _ in range(num_interactions)
-    ])
+    scores = [round(score, 3) for score in scores.tolist()]
+
+    # One batch of uniforms drives every remaining choice: channel (by weight),
+    # confidence, summary, resolution and agent. For histories this short the
+    # per-interaction gather is cheaper as a single Python pass than as
+    # separate NumPy passes per column.
+    n = num_interactions
+    draws = zip(*rng_np.random((6, n)).tolist())
+    channel_codes = np.empty(n, dtype=np.int8)
+    total_weight = _CHANNEL_CUM_WEIGHTS[-1]
+    last_channel = len(_CHANNELS) - 1
+    positive_code = _LABEL_CODE['positive']
+    negative_code = _LABEL_CODE['negative']
 
     interactions = []
-    channels = list(CHANNEL_CONFIG.keys())
-    channel_weights = [CHANNEL_CONFIG[ch]['weight'] for ch in channels]
-
-    for i, ts in enumerate(timestamps):
-        # Select channel based on weights
-        channel = rng.choices(channels, weights=channel_weights)[0]
-        channel_config = CHANNEL_CONFIG[channel]
-
-        # Calculate progress through time period (0.0 to 1.0)
-        progress = (ts - start_date).total_seconds() / (timedelta(days=days).total_seconds())
-
-        # Generate sentiment
-        score = _generate_sentiment_score(
-            rng,
-            persona_config['base_sentiment'],
-            persona_config['variance'],
-            persona_config['trend'],
-            progress
-        )
+    rows = zip(timestamps, scores, label_codes.tolist(), draws)
 
-        label = _score_to_label(score)
-        confidence = rng.randint(65, 95)
+    for i, (ts, score, label_code, (u_channel, u_conf, u_summary, u_escalate, u_open, u_agent)) in enumerate(rows):
+        channel_code = bisect(_CHANNEL_CUM_WEIGHTS, u_channel * total_weight, 0, last_channel)
+        channel_codes[i] = channel_code
 
         # Select sentiment-appropriate summary
-        summaries_by_sentiment = channel_config['summaries']
-        summary = rng.choice(summaries_by_sentiment[label])
+        candidates = _CHANNEL_SUMMARY_TABLES[channel_code][label_code]
+        summary = candidates[int(u_summary * len(candidates))]
 
         # Determine resolution based on sentiment
-        if label == 'positive':
+        if label_code == positive_code:
             resolution = 'resolved'
-        elif label == 'negative' and rng.random() > 0.6:
+        elif label_code == negative_code and u_escalate > 0.6:
             resolution = 'escalated'
         else:
-            resolution = rng.choice(['resolved', 'pending', 'resolved'])
-
-        # Create interaction
-        interaction = HistoricalInteraction(
-            id=f"INT-{customer_id}-{i+1:04d}",
-            customer_id=customer_id,
-            timestamp=ts.isoformat(),
-            channel=channel,
-            sentiment_score=round(score, 3),
-            sentiment_label=label,
-            confidence=confidence,
-            summary=summary,
-            agent_id=f"AGENT-{rng.randint(100, 999)}" if channel in ['call', 'chat'] else None,
-            resolution=resolution
-        )
-
-        interactions.append(interaction.to_dict())
+            resolution = _OPEN_RESOLUTIONS[int(u_open * 3)]
 
-    return interactions
+        # Create interaction (same fields as HistoricalInteraction.to_dict)
+        interactions.append({
+            'id': f"INT-{customer_id}-{i+1:04d}",
+            'customer_id': customer_id,
+            'timestamp': ts.isoformat(),
+            'channel': _CHANNELS[channel_code],
+            'sentiment_score': score,
+            'sentiment_label': _LABELS[label_code],
+            'confidence': 65 + int(u_conf * 31),
+            'summary': summary,
+            'agent_id': f"AGENT-{100 + int(u_agent * 900)}" if _CHANNEL_HAS_AGENT[channel_code] else None,
+            'resolution': resolution
+        })
+
+    columns = InteractionColumns(
+        scores=np.array(scores, dtype=np.float64),
+        label_codes=label_codes,
+        channel_codes=channel_codes,
+        ts_epochs=ts_epochs
+    )
+    return interactions, columns
 
 
-def calculate_sentiment_summary(interactions: List[Dict[str, Any]]) -> Dict[str, Any]:
+def calculate_sentiment_summary(
+    interactions: Union[List[Dict[str, Any]], InteractionColumns]
+) -> Dict[str, Any]:
     """
     Calculate summary statistics from interaction history.
 
     Args:
-        interactions: List of interaction records
+        interactions: List of interaction records, or their InteractionColumns
 
     Returns:
         Summary dict with stats, trend, and distributions
@@ -429,18 +591,35 @@ def calculate_sentiment_summary(interactions: List[Dict[str, Any]]) -> Dict[str,
             'last_interaction': None
         }
 
-    scores = [i['sentiment_score'] for i in interactions]
-    labels = [i['sentiment_label'] for i in interactions]
-    channels = [i['channel'] for i in interactions]
+    if isinstance(interactions, InteractionColumns):
+        return _summarize_columns(interactions)
+
+    n = len(interactions)
+    third = max(1, n // 3)
+    last_third_start = n - third
+
+    # Single pass: totals, trend sums and both breakdowns
+    total = 0.0
+    first_third_sum = 0.0
+    last_third_sum = 0.0
+    channel_breakdown = Counter()
+    sentiment_dist = Counter({'positive': 0, 'neutral': 0, 'negative': 0})
+
+    for idx, interaction in enumerate(interactions):
+        score = interaction['sentiment_score']
+        total += score
+        if idx < third:
+            first_third_sum += score
+        if idx >= last_third_start:
+            last_third_sum += score
+        channel_breakdown[interaction['channel']] += 1
+        sentiment_dist[interaction['sentiment_label']] += 1
 
     # Calculate average sentiment
-    avg_sentiment = sum(scores) / len(scores)
+    avg_sentiment = total / n
 
     # Calculate trend (compare first third vs last third)
-    third = max(1, len(scores) // 3)
-    first_third_avg = sum(scores[:third]) / third
-    last_third_avg = sum(scores[-third:]) / third
-    diff = last_third_avg - first_third_avg
+    diff = last_third_sum / third - first_third_sum / third
 
     if diff > 0.15:
         trend = 'improving'
@@ -449,18 +628,6 @@ def calculate_sentiment_summary(interactions: List[Dict[str, Any]]) -> Dict[str,
     else:
         trend = 'stable'
 
-    # Channel breakdown
-    channel_breakdown = {}
-    for ch in set(channels):
-        channel_breakdown[ch] = channels.count(ch)
-
-    # Sentiment distribution
-    sentiment_dist = {
-        'positive': labels.count('positive'),
-        'neutral': labels.count('neutral'),
-        'negative': labels.count('negative')
-    }
-
     # Calculate period in days
     if len(interactions) >= 2:
         first_ts = datetime.fromisoformat(interactions[0]['timestamp'])
@@ -470,25 +637,80 @@ def calculate_sentiment_summary(interactions: List[Dict[str, Any]]) -> Dict[str,
         period_days = 0
 
     return {
-        'total_interactions': len(interactions),
+        'total_interactions': n,
         'average_sentiment': round(avg_sentiment, 3),
         'trend': trend,
-        'channel_breakdown': channel_breakdown,
-        'sentiment_distribution': sentiment_dist,
+        'channel_breakdown': dict(channel_breakdown),
+        'sentiment_distribution': dict(sentiment_dist),
         'period_days': period_days,
         'last_interaction': interactions[-1]['timestamp'] if interactions else None
     }
 
 
-# Cache for consistent demo data within a session
-_history_cache: Dict[str, Dict[str, Any]] = {}
+def _summarize_columns(columns: InteractionColumns) -> Dict[str, Any]:
+    """Columnar path of calculate_sentiment_summary (columns must be non-empty)"""
+    scores = columns.scores
+    n = len(columns)
+
+    # Calculate trend (compare first third vs last third)
+    third = max(1, n // 3)
+    diff = scores[-third:].mean() - scores[:third].mean()
+
+    if diff > 0.15:
+        trend = 'improving'
+    elif diff < -0.15:
+        trend = 'declining'
+    else:
+        trend = 'stable'
+
+    channel_counts = np.bincount(columns.channel_codes, minlength=len(_CHANNELS)).tolist()
+    label_counts = np.bincount(columns.label_codes, minlength=len(_LABELS)).tolist()
+    sentiment_dist = {
+        'positive': label_counts[_LABEL_CODE['positive']],
+        'neutral': label_counts[_LABEL_CODE['neutral']],
+        'negative': label_counts[_LABEL_CODE['negative']]
+    }
+
+    # Epoch seconds straight from generation - no ISO parsing
+    ts_epochs = columns.ts_epochs
+    last_epoch = int(ts_epochs[-1])
+    period_days = (last_epoch - int(ts_epochs[0])) // 86400
+
+    return {
+        'total_interactions': n,
+        'average_sentiment': round(float(scores.mean()), 3),
+        'trend': trend,
+        'channel_breakdown': {ch: count for ch, count in zip(_CHANNELS, channel_counts) if count},
+        'sentiment_distribution': sentiment_dist,
+        'period_days': period_days,
+        'last_interaction': datetime.fromtimestamp(last_epoch).isoformat()
+    }
+
+
+# Bounded cache for consistent demo data within a session
+HISTORY_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=HISTORY_CACHE_SIZE)
+def _build_history(customer_id: str, days: int) -> Dict[str, Any]:
+    """Generate and summarize a customer's history (memoized per customer_id/days)"""
+    interactions, columns = _generate_history(customer_id, days, None)
+
+    return {
+        'customer_id': customer_id,
+        'customer_info': DEMO_CUSTOMERS.get(customer_id, {'name': 'Unknown Customer'}),
+        'interactions': interactions,
+        'columns': columns,
+        'summary': calculate_sentiment_summary(columns)
+    }
 
 
 def get_customer_history(customer_id: str, days: int = 90) -> Dict[str, Any]:
     """
     Get or generate customer sentiment history.
 
-    Results are cached for session consistency.
+    Results are cached for session consistency (least recently used
+    histories are evicted past HISTORY_CACHE_SIZE).
 
     Args:
         customer_id: Customer identifier
@@ -501,31 +723,23 @@ def get_customer_history(customer_id: str, days: int = 90) -> Dict[str, Any]:
     if days not in [30, 60, 90]:
         days = 90
 
-    cache_key = f"{customer_id}_{days}"
-
-    if cache_key not in _history_cache:
-        interactions = generate_customer_history(customer_id, days)
-        summary = calculate_sentiment_summary(interactions)
-
-        _history_cache[cache_key] = {
-            'customer_id': customer_id,
-            'customer_info': DEMO_CUSTOMERS.get(customer_id, {'name': 'Unknown Customer'}),
-            'interactions': interactions,
-            'summary': summary
-        }
-
-    return _history_cache[cache_key]
+    return _build_history(customer_id, days)
 
 
 def clear_history_cache():
     """Clear the history cache (useful for testing)"""
-    global _history_cache
-    _history_cache = {}
+    _build_history.cache_clear()
 
 
-def get_demo_customers() -> List[Dict[str, Any]]:
-    """Get list of available demo customers with their personas"""
-    return [
+def get_history_cache_info():
+    """Get hit/miss/size counters for the history cache"""
+    return _build_history.cache_info()
+
+
+@lru_cache(maxsize=1)
+def _demo_customers_view() -> Tuple[Dict[str, Any], ...]:
+    """Build the demo customer listing once - it only depends on module constants"""
+    return tuple(
         {
             'id': cid,
             'name': info['name'],
@@ -535,4 +749,9 @@ def get_demo_customers() -> List[Dict[str, Any]]:
             'persona_description': CUSTOMER_PERSONAS[info['persona']]['description']
         }
         for cid, info in DEMO_CUSTOMERS.items()
-    ]
+    )
+
+
+def get_demo_customers() -> List[Dict[str, Any]]:
+    """Get list of available demo customers with their personas"""
+    return list(_demo_customers_view())
@@ -0,0 +1,160 @@
+"""
+Semantic Search Cache - short-circuits near-duplicate knowledge queries
+Agents often rephrase the same question; results for a query whose embedding
+is close enough to a recent one are served from memory instead of ChromaDB.
+"""
+
+from typing import List, Dict, Optional, Tuple
+import threading
+import time
+
+import numpy as np
+
+# Constants
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL_SECONDS = 300
+CACHE_SIMILARITY_THRESHOLD = 0.92
+# An entry's hit count loses half its weight per this many idle seconds
+CACHE_DECAY_SECONDS = 60.0
+
+
+class SemanticSearchCache:
+    """
+    TTL cache of search results keyed by query embedding.
+
+    When full it evicts the least frequently *and* recently used entry:
+    each entry is worth its hit count, halved every CACHE_DECAY_SECONDS it
+    goes unused. Queries that keep trending survive a burst of one-offs,
+    which plain LRU would let flush them out.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        threshold: float = CACHE_SIMILARITY_THRESHOLD,
+        decay_seconds: float = CACHE_DECAY_SECONDS
+    ):
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self.decay_seconds = decay_seconds
+
+        # entry id -> (bucket, normalized vector, results, expires_at)
+        self._entries: Dict[int, Tuple[Tuple, np.ndarray, List[Dict], float]] = {}
+        # entry id -> [hit count, last used]
+        self._usage: Dict[int, List[float]] = {}
+        # bucket -> (entry ids, stacked vectors); rebuilt lazily after writes
+        self._matrices: Dict[Tuple, Tuple[List[int], np.ndarray]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        # No copy when the store already hands us a contiguous float32 vector
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def _bucket_matrix(self, bucket: Tuple) -> Optional[Tuple[List[int], np.ndarray]]:
+        matrix = self._matrices.get(bucket)
+        if matrix is None:
+            ids = [eid for eid, entry in self._entries.items() if entry[0] == bucket]
+            if not ids:
+                return None
+            matrix = (ids, np.stack([self._entries[eid][1] for eid in ids]))
+            self._matrices[bucket] = matrix
+        return matrix
+
+    def lookup(self, embedding, top_k: int, category: Optional[str] = None) -> Optional[List[Dict]]:
+        """Return cached results for a similar query, or None on a miss."""
+        bucket = (top_k, category)
+        vec = self._normalize(embedding)
+
+        with self._lock:
+            matrix = self._bucket_matrix(bucket)
+            if matrix is not None:
+                ids, vectors = matrix
+                scores = vectors @ vec
+                best = int(np.argmax(scores))
+                entry_id = ids[best]
+
+                if scores[best] >= self.threshold:
+                    entry = self._entries[entry_id]
+                    now = time.monotonic()
+                    if entry[3] > now:
+                        usage = self._usage[entry_id]
+                        usage[0] += 1
+                        usage[1] = now
+                        self.hits += 1
+                        return entry[2]
+
+                    # Expired - drop it so the next lookup doesn't see it
+                    self._remove(entry_id)
+
+            self.misses += 1
+            return None
+
+    def store(self, embedding, top_k: int, category: Optional[str], results: List[Dict]):
+        """Cache results for a query embedding."""
+        bucket = (top_k, category)
+        vec = self._normalize(embedding)
+
+        with self._lock:
+            now = time.monotonic()
+            # Make room first, so the new entry isn't its own eviction candidate
+            while self._entries and len(self._entries) >= self.max_entries:
+                self._remove(min(self._entries, key=lambda eid: self._retention(eid, now)))
+
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (bucket, vec, results, now + self.ttl_seconds)
+            self._usage[entry_id] = [0, now]
+            self._matrices.pop(bucket, None)
+
+    def _retention(self, entry_id: int, now: float) -> float:
+        """How much an entry is worth keeping (expired entries are worth nothing)."""
+        if self._entries[entry_id][3] <= now:
+            return -1.0
+        hit_count, last_used = self._usage[entry_id]
+        return (1 + hit_count) * 0.5 ** ((now - last_used) / self.decay_seconds)
+
+    def _remove(self, entry_id: int):
+        bucket = self._entries.pop(entry_id)[0]
+        del self._usage[entry_id]
+        self._matrices.pop(bucket, None)
+
+    def clear(self):
+        """Drop all cached results (call whenever the knowledge base changes)."""
+        with self._lock:
+            self._entries.clear()
+            self._usage.clear()
+            self._matrices.clear()
+
+    def get_stats(self) -> Dict:
+        """Get cache size and hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# Singleton instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SemanticSearchCache:
+    """Get or create the singleton search cache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        # Concurrent first calls from the thread pool must share one cache
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = SemanticSearchCache()
+    return _cache_instance
@@ -14,12 +14,25 @@ Usage:
 
 from enum import Enum
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+import os
+import threading
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Distinct texts whose VADER scores are kept (dashboards re-poll the same messages)
+VADER_CACHE_SIZE = 10000
+# Texts per transformer forward pass in batch analysis
+TRANSFORMER_BATCH_SIZE = 16
+# DistilBERT's position limit; longer inputs are cut by the tokenizer
+TRANSFORMER_MAX_TOKENS = 512
+
+# torch.compile the PyTorch model on load (SENTIMENT_COMPILE=1)
+SENTIMENT_COMPILE = os.getenv("SENTIMENT_COMPILE", "0") == "1"
+
 
 class SentimentProvider(Enum):
     """Available sentiment analysis providers"""
@@ -53,17 +66,27 @@ class VaderSentimentAnalyzer:
 
     def __init__(self):
         self._analyzer = None
+        self._load_lock = threading.Lock()
+        # Per instance, so the cache goes away with the analyzer
+        self._polarity_scores = lru_cache(maxsize=VADER_CACHE_SIZE)(self._score)
+
+    def _score(self, text: str) -> Dict[str, float]:
+        return self._analyzer.polarity_scores(text)
 
     def _ensure_loaded(self):
         """Lazy load VADER analyzer"""
-        if self._analyzer is None:
-            try:
-                from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-                self._analyzer = SentimentIntensityAnalyzer()
-                logger.info("VADER sentiment analyzer loaded")
-            except ImportError as e:
-                logger.error(f"Failed to import VADER: {e}")
-                raise ImportError("vaderSentiment not installed. Run: pip install vaderSentiment")
+        if self._analyzer is not None:
+            return
+        # Concurrent first calls from the API thread pool load it once
+        with self._load_lock:
+            if self._analyzer is None:
+                try:
+                    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+                    self._analyzer = SentimentIntensityAnalyzer()
+                    logger.info("VADER sentiment analyzer loaded")
+                except ImportError as e:
+                    logger.error(f"Failed to import VADER: {e}")
+                    raise ImportError("vaderSentiment not installed. Run: pip install vaderSentiment")
 
     def analyze(self, text: str) -> SentimentResult:
         """
@@ -79,8 +102,8 @@ class VaderSentimentAnalyzer:
 
         start = time.time()
 
-        # Get VADER scores
-        scores = self._analyzer.polarity_scores(text)
+        # Get VADER scores (repeated texts come from the cache)
+        scores = self._polarity_scores(text)
         compound = scores['compound']
 
         # Determine sentiment category from compound score
@@ -133,23 +156,52 @@ class TransformerSentimentAnalyzer:
     def __init__(self, model_name: str = "distilbert-base-uncased-finetuned-sst-2-english"):
         self._classifier = None
         self._model_name = model_name
+        self._load_lock = threading.Lock()
 
     def _ensure_loaded(self):
         """Lazy load transformer model"""
-        if self._classifier is None:
+        if self._classifier is not None:
+            return
+        # Concurrent first calls from the API thread pool load the ~250MB model once
+        with self._load_lock:
+            if self._classifier is not None:
+                return
             try:
-                from transformers import pipeline
-                logger.info(f"Loading transformer model: {self._model_name}")
-                self._classifier = pipeline(
-                    "sentiment-analysis",
-                    model=self._model_name,
-                    device=-1  # CPU; use 0 for GPU
-                )
-                logger.info("Transformer sentiment analyzer loaded")
+                classifier = self._load_pytorch()
+                # The first inference pays one-off allocation / kernel selection
+                # (and compilation with SENTIMENT_COMPILE) - take it here, not on a request
+                classifier("warm up")
             except Exception as e:
                 logger.error(f"Failed to load transformer: {e}")
                 raise ImportError(f"Failed to load transformer model: {e}")
 
+            self._classifier = classifier
+
+    def warm_up(self):
+        """Load and warm up the model now instead of on the first analysis."""
+        self._ensure_loaded()
+
+    def _load_pytorch(self):
+        """Build the default PyTorch pipeline, compiled with SENTIMENT_COMPILE=1."""
+        from transformers import pipeline
+        logger.info(f"Loading transformer model: {self._model_name}")
+        classifier = pipeline(
+            "sentiment-analysis",
+            model=self._model_name,
+            device=-1  # CPU; use 0 for GPU
+        )
+
+        if SENTIMENT_COMPILE:
+            try:
+                import torch
+                classifier.model = torch.compile(classifier.model)
+                logger.info("Transformer model compiled with torch.compile")
+            except Exception as e:
+                logger.warning(f"torch.compile unavailable, running eagerly: {e}")
+
+        logger.info("Transformer sentiment analyzer loaded")
+        return classifier
+
     def analyze(self, text: str) -> SentimentResult:
         """
         Analyze sentiment using transformer model.
@@ -164,11 +216,41 @@ class TransformerSentimentAnalyzer:
 
         start = time.time()
 
-        # Truncate text to model's max length
-        text_truncated = text[:512] if len(text) > 512 else text
+        # Get prediction (the tokenizer truncates to the model's max length)
+        result = self._classifier(text, truncation=True, max_length=TRANSFORMER_MAX_TOKENS)[0]
+
+        processing_time = int((time.time() - start) * 1000)
+        return self._to_result(result, processing_time)
+
+    def analyze_batch(self, texts: List[str]) -> List[SentimentResult]:
+        """
+        Analyze several texts in batched forward passes.
+
+        Args:
+            texts: Texts to analyze (each truncated to 512 tokens)
+
+        Returns:
+            SentimentResults in input order; processing_time_ms is the
+            batch time averaged per text
+        """
+        self._ensure_loaded()
+        if not texts:
+            return []
+
+        start = time.time()
+
+        predictions = self._classifier(
+            texts,
+            batch_size=TRANSFORMER_BATCH_SIZE,
+            truncation=True,
+            max_length=TRANSFORMER_MAX_TOKENS
+        )
+
+        processing_time = int((time.time() - start) * 1000 / len(texts))
+        return [self._to_result(result, processing_time) for result in predictions]
 
-        # Get prediction
-        result = self._classifier(text_truncated)[0]
+    def _to_result(self, result: Dict[str, Any], processing_time: int) -> SentimentResult:
+        """Map one pipeline prediction to a SentimentResult."""
         label = result['label'].upper()
         score_raw = result['score']
 
@@ -188,8 +270,6 @@ class TransformerSentimentAnalyzer:
         # Confidence is the raw probability
         confidence = round(score_raw * 100, 1)
 
-        processing_time = int((time.time() - start) * 1000)
-
         return SentimentResult(
             provider='transformer',
             sentiment=sentiment,
@@ -207,13 +287,16 @@ class TransformerSentimentAnalyzer:
 # Singleton instances (lazy loaded)
 _vader_analyzer: Optional[VaderSentimentAnalyzer] = None
 _transformer_analyzer: Optional[TransformerSentimentAnalyzer] = None
+_singleton_lock = threading.Lock()
 
 
 def get_vader_analyzer() -> VaderSentimentAnalyzer:
     """Get or create VADER analyzer singleton"""
     global _vader_analyzer
     if _vader_analyzer is None:
-        _vader_analyzer = VaderSentimentAnalyzer()
+        with _singleton_lock:
+            if _vader_analyzer is None:
+                _vader_analyzer = VaderSentimentAnalyzer()
     return _vader_analyzer
 
 
@@ -221,7 +304,9 @@ def get_transformer_analyzer() -> TransformerSentimentAnalyzer:
     """Get or create transformer analyzer singleton"""
     global _transformer_analyzer
     if _transformer_analyzer is None:
-        _transformer_analyzer = TransformerSentimentAnalyzer()
+        with _singleton_lock:
+            if _transformer_analyzer is None:
+                _transformer_analyzer = TransformerSentimentAnalyzer()
     return _transformer_analyzer
 
 
@@ -245,14 +330,7 @@ def analyze_sentiment(
         positive: 87.5% confident
     """
     if not text or not text.strip():
-        return SentimentResult(
-            provider=provider.value,
-            sentiment='neutral',
-            score=0.0,
-            confidence=50.0,
-            processing_time_ms=0,
-            breakdown={'error': 'Empty text provided'}
-        )
+        return _empty_text_result(provider)
 
     try:
         if provider == SentimentProvider.VADER:
@@ -261,15 +339,74 @@ def analyze_sentiment(
             return get_transformer_analyzer().analyze(text)
     except Exception as e:
         logger.error(f"Sentiment analysis failed: {e}")
-        # Fallback to neutral on error
-        return SentimentResult(
-            provider=provider.value,
-            sentiment='neutral',
-            score=0.0,
-            confidence=0.0,
-            processing_time_ms=0,
-            breakdown={'error': str(e)}
-        )
+        return _failed_result(provider, e)
+
+
+def analyze_sentiment_batch(
+    texts: List[str],
+    provider: SentimentProvider = SentimentProvider.VADER
+) -> List[SentimentResult]:
+    """
+    Analyze several texts with one provider.
+
+    The transformer runs the texts through the model in batches, which is
+    much cheaper per text than one call each. Results are in input order.
+
+    Args:
+        texts: Texts to analyze
+        provider: Which analyzer to use (VADER or TRANSFORMER)
+
+    Returns:
+        List of SentimentResult, one per text
+    """
+    results: List[Optional[SentimentResult]] = [None] * len(texts)
+    pending = []
+    for i, text in enumerate(texts):
+        if text and text.strip():
+            pending.append(i)
+        else:
+            results[i] = _empty_text_result(provider)
+
+    try:
+        if provider == SentimentProvider.VADER:
+            analyzer = get_vader_analyzer()
+            # Score each distinct text once
+            unique = {texts[i]: None for i in pending}
+            for text in unique:
+                unique[text] = analyzer.analyze(text)
+            analyzed = [unique[texts[i]] for i in pending]
+        else:
+            analyzed = get_transformer_analyzer().analyze_batch([texts[i] for i in pending])
+    except Exception as e:
+        logger.error(f"Sentiment analysis failed: {e}")
+        analyzed = [_failed_result(provider, e) for _ in pending]
+
+    for i, result in zip(pending, analyzed):
+        results[i] = result
+    return results
+
+
+def _empty_text_result(provider: SentimentProvider) -> SentimentResult:
+    return SentimentResult(
+        provider=provider.value,
+        sentiment='neutral',
+        score=0.0,
+        confidence=50.0,
+        processing_time_ms=0,
+        breakdown={'error': 'Empty text provided'}
+    )
+
+
+def _failed_result(provider: SentimentProvider, error: Exception) -> SentimentResult:
+    # Fallback to neutral on error
+    return SentimentResult(
+        provider=provider.value,
+        sentiment='neutral',
+        score=0.0,
+        confidence=0.0,
+        processing_time_ms=0,
+        breakdown={'error': str(error)}
+    )
 
 
 def analyze_sentiment_both(text: str) -> Dict[str, SentimentResult]:
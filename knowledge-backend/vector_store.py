@@ -6,9 +6,15 @@ Handles document embedding, storage, and retrieval.
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+from functools import lru_cache
+import numpy as np
+import hashlib
 import os
 import json
+import platform
+import threading
+import time
 
 # Constants
 COLLECTION_NAME = "genesys_knowledge"
@@ -16,10 +22,52 @@ EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 CHUNK_SIZE = 500
 CHUNK_OVERLAP = 50
 TOP_K_DEFAULT = 5
+EMBED_BATCH_SIZE = 64
+STATS_TTL_SECONDS = 5
+QUERY_EMBED_CACHE_SIZE = 2048
+QUERY_EMBED_CACHE_MAX_CHARS = 512
+SUMMARY_MAX_CHARS = 200
+# Categories up to this many chunks are searched exactly in NumPy instead of via HNSW
+EXACT_SEARCH_MAX_CHUNKS = 2000
+
+# ONNX Runtime backend with int8-quantized weights (USE_ONNX=1)
+USE_ONNX = os.getenv("USE_ONNX", "0") == "1"
+ONNX_QUANTIZED_FILES = {
+    "arm64": "onnx/model_qint8_arm64.onnx",
+    "x86_64": "onnx/model_qint8_avx512_vnni.onnx",
+}
 
 # Initialize paths
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 CHROMA_DIR = os.path.join(DATA_DIR, "chroma")
+# float16 embeddings of the bundled sample chunks, reused across load-samples calls
+SAMPLE_EMBEDDINGS_PATH = os.path.join(DATA_DIR, "sample_embeddings.npz")
+
+
+def load_embedder(model_name: str, use_onnx: bool = False) -> SentenceTransformer:
+    """
+    Load the sentence-transformers embedding model.
+
+    With use_onnx, the model runs on ONNX Runtime using the int8-quantized
+    export for this CPU (needs `pip install sentence-transformers[onnx]`).
+    Falls back to the default PyTorch backend if that can't be loaded.
+    """
+    if use_onnx:
+        machine = platform.machine().lower()
+        arch = "arm64" if machine in ("arm64", "aarch64") else "x86_64"
+        file_name = ONNX_QUANTIZED_FILES[arch]
+        try:
+            embedder = SentenceTransformer(
+                model_name,
+                backend="onnx",
+                model_kwargs={"file_name": file_name}
+            )
+            print(f"Using ONNX Runtime backend ({file_name})")
+            return embedder
+        except Exception as e:
+            print(f"ONNX backend unavailable, falling back to PyTorch: {e}")
+
+    return SentenceTransformer(model_name)
 
 
 class KnowledgeStore:
@@ -34,7 +82,7 @@ class KnowledgeStore:
 
         # Initialize embedding model
         print(f"Loading embedding model: {EMBEDDING_MODEL}")
-        self.embedder = SentenceTransformer(EMBEDDING_MODEL)
+        self.embedder = load_embedder(EMBEDDING_MODEL, use_onnx=USE_ONNX)
 
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
@@ -42,6 +90,16 @@ class KnowledgeStore:
             metadata={"description": "Genesys Cloud documentation"}
         )
 
+        # LRU of query embeddings, per instance so it dies with the model
+        self._query_embeddings = lru_cache(maxsize=QUERY_EMBED_CACHE_SIZE)(self._embed_query)
+
+        # Cached get_stats() result and its expiry (monotonic seconds)
+        self._stats_cache: Optional[Dict] = None
+        self._stats_expires = 0.0
+
+        # category -> its chunks for exact search (None if too large); dropped on writes
+        self._category_chunks: Dict[str, Optional[Dict]] = {}
+
         print(f"Knowledge store initialized. Documents: {self.collection.count()}")
 
     def chunk_text(self, text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
@@ -56,25 +114,102 @@ class KnowledgeStore:
 
         return chunks
 
+    def _encode(self, texts, batch_size: int = EMBED_BATCH_SIZE) -> np.ndarray:
+        """
+        Encode text(s) to unit-length vectors in a C-contiguous float32 array.
+
+        This is the layout ChromaDB and NumPy use, so downstream consumers
+        don't pay for a hidden dtype conversion or copy. Unit length makes the
+        collection's squared L2 distance equal to 2 - 2 * cosine similarity.
+        """
+        embeddings = self.embedder.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
     def embed_text(self, text: str) -> List[float]:
         """Generate embedding for text."""
-        return self.embedder.encode(text).tolist()
+        return self._encode(text).tolist()
+
+    def _embed_query(self, text: str) -> np.ndarray:
+        embedding = self._encode(text)
+        embedding.setflags(write=False)
+        return embedding
 
-    def embed_texts(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
-        return self.embedder.encode(texts).tolist()
+    def encode_cached(self, text: str) -> np.ndarray:
+        """Generate a float32 query embedding, reusing recent embeddings of short texts."""
+        if len(text) > QUERY_EMBED_CACHE_MAX_CHARS:
+            return self._embed_query(text)
+        return self._query_embeddings(text)
 
-    def ingest_documents(self, documents: List[Dict]) -> Dict:
+    def embed_texts(self, texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> List[List[float]]:
         """
-        Ingest documents into the vector store.
+        Generate embeddings for multiple texts.
+
+        sentence-transformers sorts the texts by length before batching, so
+        passing everything in one call keeps padding per batch minimal.
+        """
+        return self._encode(texts, batch_size).tolist()
+
+    def embed_texts_persistent(self, texts: List[str], cache_path: str) -> List[List[float]]:
+        """
+        Generate embeddings, reusing the ones saved at cache_path by earlier calls.
+
+        Vectors are keyed by model + backend + text and stored as float16
+        (half the size), so static texts such as the sample documents are
+        only run through the model once.
+        """
+        # PyTorch and int8 ONNX give slightly different vectors; don't mix them
+        backend = getattr(self.embedder, "backend", "torch")
+        keys = [
+            hashlib.blake2b(f"{EMBEDDING_MODEL}\0{backend}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+            for text in texts
+        ]
+
+        cached: Dict[str, np.ndarray] = {}
+        if os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as data:
+                    cached = dict(zip(data["keys"].tolist(), data["vectors"]))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Ignoring unreadable embedding cache {cache_path}: {e}")
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if missing:
+            fresh = self._encode(list(missing.values()))
+            cached.update(zip(missing, fresh.astype(np.float16)))
+
+            # Keep only the current texts, so edited samples don't pile up
+            keep = list(dict.fromkeys(keys))
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez(f, keys=np.array(keep), vectors=np.stack([cached[k] for k in keep]))
+            os.replace(tmp_path, cache_path)
+
+        if not keys:
+            return []
+        # Always serve the stored float16 values, so cold and warm runs agree;
+        # renormalize since rounding moves them slightly off unit length
+        vectors = np.stack([cached[k] for k in keys]).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors.tolist()
+
+    def prepare_chunks(self, documents: List[Dict]) -> Tuple[List[Dict], int]:
+        """
+        Chunk documents into records ready for embedding.
 
         Args:
             documents: List of document dicts with id, title, content, url, category
 
         Returns:
-            Stats about ingestion
+            Tuple of (chunk records with id, embed_text, document, metadata;
+            number of documents that had content)
         """
-        total_chunks = 0
+        records = []
         doc_count = 0
 
         for doc in documents:
@@ -91,36 +226,67 @@ class KnowledgeStore:
             chunks = self.chunk_text(content)
 
             for i, chunk in enumerate(chunks):
-                chunk_id = f"{doc_id}_chunk_{i}"
-
-                # Prepare text for embedding (include title for context)
-                embed_text = f"{title}\n\n{chunk}"
-
-                # Generate embedding
-                embedding = self.embed_text(embed_text)
-
-                # Add to collection
-                self.collection.add(
-                    ids=[chunk_id],
-                    embeddings=[embedding],
-                    documents=[chunk],
-                    metadatas=[{
+                records.append({
+                    "id": f"{doc_id}_chunk_{i}",
+                    # Prepare text for embedding (include title for context)
+                    "embed_text": f"{title}\n\n{chunk}",
+                    "document": chunk,
+                    "metadata": {
                         "doc_id": doc_id,
                         "title": title,
                         "url": url,
                         "category": category,
                         "chunk_index": i,
                         "total_chunks": len(chunks)
-                    }]
-                )
-
-                total_chunks += 1
+                    }
+                })
 
             doc_count += 1
 
+        return records, doc_count
+
+    def add_chunks(self, records: List[Dict], embeddings: List[List[float]]):
+        """Write embedded chunk records to the collection in as few calls as ChromaDB allows."""
+        if not records:
+            return
+
+        # One add per batch - ChromaDB rejects batches above its SQLite parameter limit
+        batch_size = self.client.get_max_batch_size()
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            self.collection.add(
+                ids=[r["id"] for r in batch],
+                embeddings=embeddings[start:start + batch_size],
+                documents=[r["document"] for r in batch],
+                metadatas=[r["metadata"] for r in batch]
+            )
+        self._invalidate_caches()
+
+    def ingest_documents(self, documents: List[Dict], embedding_cache: Optional[str] = None) -> Dict:
+        """
+        Ingest documents into the vector store.
+
+        Args:
+            documents: List of document dicts with id, title, content, url, category
+            embedding_cache: Optional .npz path to reuse chunk embeddings from
+
+        Returns:
+            Stats about ingestion
+        """
+        records, doc_count = self.prepare_chunks(documents)
+
+        # Generate all embeddings in length-sorted batches
+        texts = [record["embed_text"] for record in records]
+        if embedding_cache:
+            embeddings = self.embed_texts_persistent(texts, embedding_cache)
+        else:
+            embeddings = self.embed_texts(texts) if records else []
+
+        self.add_chunks(records, embeddings)
+
         return {
             "documents_ingested": doc_count,
-            "chunks_created": total_chunks,
+            "chunks_created": len(records),
             "total_documents": self.collection.count()
         }
 
@@ -128,7 +294,8 @@ class KnowledgeStore:
         self,
         query: str,
         top_k: int = TOP_K_DEFAULT,
-        category_filter: Optional[str] = None
+        category_filter: Optional[str] = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict]:
         """
         Search for relevant documents.
@@ -137,12 +304,19 @@ class KnowledgeStore:
             query: Search query
             top_k: Number of results to return
             category_filter: Optional category to filter by
+            query_embedding: Precomputed embedding of the query (skips re-embedding)
 
         Returns:
             List of relevant document chunks with metadata
         """
         # Generate query embedding
-        query_embedding = self.embed_text(query)
+        if query_embedding is None:
+            query_embedding = self.encode_cached(query)
+
+        # Small categories: exact scan of their cached chunks, no HNSW traversal
+        chunks = self._get_category_chunks(category_filter) if category_filter else None
+        if chunks is not None:
+            return self._format_results(self._exact_search(chunks, [query_embedding], top_k), 0)
 
         # Build where filter if category specified
         where_filter = None
@@ -157,18 +331,126 @@ class KnowledgeStore:
             include=["documents", "metadatas", "distances"]
         )
 
-        # Format results
+        return self._format_results(results, 0)
+
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = TOP_K_DEFAULT,
+        category_filter: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        Search for relevant documents for several queries at once.
+
+        All queries are embedded in a single model call and sent to ChromaDB
+        in a single query, instead of one round-trip per query.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query
+            category_filter: Optional category to filter by
+
+        Returns:
+            One list of relevant document chunks per query, in input order
+        """
+        if not queries:
+            return []
+
+        # Generate all query embeddings in one forward pass
+        query_embeddings = self._encode(queries)
+
+        chunks = self._get_category_chunks(category_filter) if category_filter else None
+        if chunks is not None:
+            results = self._exact_search(chunks, query_embeddings, top_k)
+        else:
+            # Build where filter if category specified
+            where_filter = None
+            if category_filter:
+                where_filter = {"category": category_filter}
+
+            # Search
+            results = self.collection.query(
+                query_embeddings=query_embeddings,
+                n_results=top_k,
+                where=where_filter,
+                include=["documents", "metadatas", "distances"]
+            )
+
+        return [self._format_results(results, q) for q in range(len(queries))]
+
+    def _get_category_chunks(self, category: str) -> Optional[Dict]:
+        """
+        Load (once per write) the chunks of a category small enough to scan exactly.
+
+        Returns None for categories over EXACT_SEARCH_MAX_CHUNKS, which stay on HNSW,
+        and for categories with no chunks. Only categories that exist are cached, so
+        the cache is bounded by the collection's categories, not by client input.
+        """
+        cache = self._category_chunks
+        if category in cache:
+            return cache[category]
+
+        hits = self.collection.get(
+            where={"category": category},
+            limit=EXACT_SEARCH_MAX_CHUNKS + 1,
+            include=["embeddings", "documents", "metadatas"]
+        )
+
+        if not hits["ids"]:
+            return None
+
+        chunks = None
+        if len(hits["ids"]) <= EXACT_SEARCH_MAX_CHUNKS:
+            embeddings = np.asarray(hits["embeddings"], dtype=np.float32)
+            chunks = {
+                "embeddings": embeddings,
+                "squared_norms": np.einsum("ij,ij->i", embeddings, embeddings),
+                "documents": hits["documents"],
+                "metadatas": hits["metadatas"]
+            }
+
+        # Store into the dict we read from, so a write that cleared the cache meanwhile wins
+        cache[category] = chunks
+        return chunks
+
+    @staticmethod
+    def _exact_search(chunks: Dict, query_embeddings, top_k: int) -> Dict:
+        """
+        Brute-force nearest chunks, shaped like a collection.query() result.
+
+        Distances are squared L2, the collection's metric, so relevance
+        scores match the HNSW path.
+        """
+        results = {"documents": [], "metadatas": [], "distances": []}
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1)
+
+        for query in queries:
+            if not len(chunks["documents"]):
+                distances = np.empty(0, dtype=np.float32)
+            else:
+                distances = chunks["squared_norms"] - 2 * (chunks["embeddings"] @ query) + query @ query
+            order = np.argsort(distances, kind="stable")[:top_k]
+
+            results["documents"].append([chunks["documents"][i] for i in order])
+            results["metadatas"].append([chunks["metadatas"][i] for i in order])
+            results["distances"].append(np.maximum(distances[order], 0).tolist())
+
+        return results
+
+    def _format_results(self, results: Dict, query_index: int) -> List[Dict]:
+        """Format the ChromaDB results of one query into result dicts."""
         formatted_results = []
-        if results and results['documents'] and results['documents'][0]:
-            for i, doc in enumerate(results['documents'][0]):
-                metadata = results['metadatas'][0][i] if results['metadatas'] else {}
-                distance = results['distances'][0][i] if results['distances'] else 0
+        if results and results['documents'] and results['documents'][query_index]:
+            for i, doc in enumerate(results['documents'][query_index]):
+                metadata = results['metadatas'][query_index][i] if results['metadatas'] else {}
+                distance = results['distances'][query_index][i] if results['distances'] else 0
 
-                # Convert distance to relevance score (1 - normalized distance)
-                relevance = max(0, 1 - distance)
+                # Unit vectors: squared L2 distance -> cosine similarity
+                relevance = max(0, 1 - distance / 2)
 
                 formatted_results.append({
                     "content": doc,
+                    "summary": f"{doc[:SUMMARY_MAX_CHARS]}..." if len(doc) > SUMMARY_MAX_CHARS else doc,
                     "title": metadata.get("title", ""),
                     "url": metadata.get("url", ""),
                     "category": metadata.get("category", ""),
@@ -180,12 +462,26 @@ class KnowledgeStore:
         return formatted_results
 
     def get_stats(self) -> Dict:
-        """Get statistics about the knowledge base."""
+        """Get statistics about the knowledge base (cached for a few seconds)."""
+        now = time.monotonic()
+        if self._stats_cache is None or now >= self._stats_expires:
+            self._stats_cache = self._compute_stats()
+            self._stats_expires = now + STATS_TTL_SECONDS
+        return self._stats_cache
+
+    def _invalidate_caches(self):
+        """Drop cached stats and category chunks after the collection changes."""
+        self._stats_cache = None
+        self._category_chunks = {}
+
+    def _compute_stats(self) -> Dict:
+        """Compute statistics from the collection."""
         count = self.collection.count()
 
         # Get sample of metadatas to analyze categories
         if count > 0:
-            sample = self.collection.peek(limit=min(count, 100))
+            # Metadata only - peek() would also load documents and embeddings
+            sample = self.collection.get(limit=min(count, 100), include=["metadatas"])
             categories = {}
             titles = set()
 
@@ -211,17 +507,14 @@ class KnowledgeStore:
     def delete_document(self, doc_id: str) -> bool:
         """Delete all chunks for a document."""
         try:
-            # Find all chunks for this document
-            results = self.collection.get(
-                where={"doc_id": doc_id},
-                include=["metadatas"]
-            )
-
-            if results and results['ids']:
-                self.collection.delete(ids=results['ids'])
-                return True
-
-            return False
+            # Ids only - no documents, metadatas or embeddings are loaded
+            ids = self.collection.get(where={"doc_id": doc_id}, include=[])["ids"]
+            if not ids:
+                return False
+
+            self.collection.delete(ids=ids)
+            self._invalidate_caches()
+            return True
         except Exception as e:
             print(f"Error deleting document: {e}")
             return False
@@ -233,39 +526,69 @@ class KnowledgeStore:
             name=COLLECTION_NAME,
             metadata={"description": "Genesys Cloud documentation"}
         )
+        self._invalidate_caches()
 
     def get_all_documents(self, limit: int = 100) -> List[Dict]:
         """Get all unique documents (not chunks) in the store."""
-        results = self.collection.peek(limit=limit)
+        return list(self.iter_documents(limit=limit))
+
+    def iter_documents(self, limit: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over unique documents (not chunks) in the store.
+
+        The collection is read immediately (so errors surface to the caller);
+        documents are then yielded one at a time.
+        """
+        results = self.collection.get(limit=limit, include=["metadatas"])
+        return self._unique_documents(results.get('metadatas', []))
 
+    @staticmethod
+    def _unique_documents(metadatas: List[Dict]) -> Iterator[Dict]:
         # Deduplicate by title
         seen = set()
-        documents = []
 
-        for i, meta in enumerate(results.get('metadatas', [])):
+        for meta in metadatas:
             title = meta.get('title', '')
             if title not in seen:
                 seen.add(title)
-                documents.append({
+                yield {
                     "id": meta.get('doc_id', ''),
                     "title": title,
                     "url": meta.get('url', ''),
                     "category": meta.get('category', ''),
                     "chunks": meta.get('total_chunks', 1)
-                })
+                }
+
+
+def merge_results(result_lists: List[List[Dict]], top_k: int = TOP_K_DEFAULT) -> List[Dict]:
+    """
+    Merge results of several queries into one ranked list.
+
+    Chunks found by more than one query keep their best relevance.
+    """
+    best: Dict[Tuple, Dict] = {}
+    for results in result_lists:
+        for r in results:
+            key = (r["url"], r["title"], r["chunk_index"])
+            if key not in best or r["relevance"] > best[key]["relevance"]:
+                best[key] = r
 
-        return documents
+    return sorted(best.values(), key=lambda r: r["relevance"], reverse=True)[:top_k]
 
 
 # Singleton instance
 _store_instance = None
+_store_lock = threading.Lock()
 
 
 def get_store() -> KnowledgeStore:
     """Get or create the singleton knowledge store instance."""
     global _store_instance
     if _store_instance is None:
-        _store_instance = KnowledgeStore()
+        # Two concurrent first calls would otherwise each load the embedding model
+        with _store_lock:
+            if _store_instance is None:
+                _store_instance = KnowledgeStore()
     return _store_instance
 
 